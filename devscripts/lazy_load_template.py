@@ -30,7 +30,12 @@ class LazyLoadExtractor(metaclass=LazyLoadMetaClass):
     @classproperty
     def real_class(cls):
         if '_real_class' not in cls.__dict__:
-            cls._real_class = getattr(importlib.import_module(cls._module), cls.__name__)
+            real_class = getattr(importlib.import_module(cls._module), cls.__name__)
+            # Reuse the regexes already compiled by the lazy class for URL matching
+            if ('_VALID_URL_RE' in cls.__dict__ and '_VALID_URL_RE' not in real_class.__dict__
+                    and real_class._VALID_URL == cls._VALID_URL):
+                real_class._VALID_URL_RE = cls._VALID_URL_RE
+            cls._real_class = real_class
         return cls._real_class
 
     def __new__(cls, *args, **kwargs):
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 
 # Allow direct execution
+import collections
+import functools
+import heapq
+import itertools
 import os
 import shutil
 import sys
@@ -8,9 +12,10 @@
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
-from inspect import getsource
+import inspect
+import linecache
 
-from devscripts.utils import get_filename_args, read_file, write_file
+from devscripts.utils import get_filename_args, read_file
 
 NO_ATTR = object()
 STATIC_CLASS_PROPERTIES = [
@@ -26,17 +31,17 @@
     'is_suitable',  # Used for --age-limit
     'supports_login', 'is_single_video',  # Accessed in CLI only with instance
 ]
-IE_TEMPLATE = '''
-class {name}({bases}):
-    _module = {module!r}
-'''
+LAZY_BASE_NAMES = {
+    'InfoExtractor': 'LazyLoadExtractor',
+    'SearchInfoExtractor': 'LazyLoadSearchExtractor',
+}
 MODULE_TEMPLATE = read_file('devscripts/lazy_load_template.py')
 
 
 def main():
     lazy_extractors_filename = get_filename_args(default_outfile='yt_dlp/extractor/lazy_extractors.py')
-    if os.path.exists(lazy_extractors_filename):
-        os.remove(lazy_extractors_filename)
+    # Load the real extractors even if a previous lazy_extractors.py exists; it is only replaced on success
+    os.environ['YTDLP_NO_LAZY_EXTRACTORS'] = '1'
 
     _ALL_CLASSES = get_all_ies()  # Must be before import
 
@@ -47,15 +52,22 @@ def main():
     _ALL_CLASSES = [cls for cls in _ALL_CLASSES if not cls.__module__.startswith(f'{yt_dlp.plugins.PACKAGE_NAME}.')]
 
     DummyInfoExtractor = type('InfoExtractor', (InfoExtractor,), {'IE_NAME': NO_ATTR})
-    module_src = '\n'.join((
-        MODULE_TEMPLATE,
-        '    _module = None',
-        *extra_ie_code(DummyInfoExtractor),
-        '\nclass LazyLoadSearchExtractor(LazyLoadExtractor):\n    pass\n',
-        *build_ies(_ALL_CLASSES, (InfoExtractor, SearchInfoExtractor), DummyInfoExtractor),
-    ))
-
-    write_file(lazy_extractors_filename, f'{module_src}\n')
+    # Write to a temporary file next to the target, so that a failed run never leaves a
+    # partially written module behind for yt_dlp.extractor.extractors to pick up
+    tmp_filename = f'{lazy_extractors_filename}.part'
+    try:
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            f.writelines(f'{section}\n' for section in itertools.chain(
+                (MODULE_TEMPLATE, '    _module = None'),
+                extra_ie_code(DummyInfoExtractor),
+                ('\nclass LazyLoadSearchExtractor(LazyLoadExtractor):\n    pass\n',),
+                build_ies(_ALL_CLASSES, (InfoExtractor, SearchInfoExtractor), DummyInfoExtractor),
+            ))
+        os.replace(tmp_filename, lazy_extractors_filename)
+    except BaseException:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
 
 
 def get_all_ies():
@@ -72,24 +84,40 @@ def get_all_ies():
     return _ALL_CLASSES
 
 
+def getsource(method):
+    """Same as inspect.getsource, but skips the module lookup; the source file is cached by linecache"""
+    code = method.__func__.__code__
+    lines = linecache.getlines(code.co_filename)
+    return ''.join(inspect.getblock(lines[code.co_firstlineno - 1:]))
+
+
+@functools.cache
+def get_base_attrs(base):
+    if not base:
+        return {}, {}
+    return ({var: getattr(base, var) for var in STATIC_CLASS_PROPERTIES},
+            {name: getattr(base, name).__func__ for name in CLASS_METHODS})
+
+
 def extra_ie_code(ie, base=None):
+    base_values, base_funcs = get_base_attrs(base)
     for var in STATIC_CLASS_PROPERTIES:
         val = getattr(ie, var)
-        if val != (getattr(base, var) if base else NO_ATTR):
+        if val != base_values.get(var, NO_ATTR):
             yield f'    {var} = {val!r}'
     yield ''
 
     for name in CLASS_METHODS:
         f = getattr(ie, name)
-        if not base or f.__func__ != getattr(base, name).__func__:
+        if f.__func__ is not base_funcs.get(name):
             yield getsource(f)
 
 
 def build_ies(ies, bases, attr_base):
-    names = []
+    names, all_ies = [], set(ies)
     for ie in sort_ies(ies, bases):
         yield build_lazy_ie(ie, ie.__name__, attr_base)
-        if ie in ies:
+        if ie in all_ies:
             names.append(ie.__name__)
 
     yield f'\n_ALL_CLASSES = [{", ".join(names)}]'
@@ -97,35 +125,44 @@ def build_ies(ies, bases, attr_base):
 
 def sort_ies(ies, ignored_bases):
     """find the correct sorting and add the required base classes so that subclasses can be correctly created"""
-    classes, returned_classes = ies[:-1], set()
     assert ies[-1].__name__ == 'GenericIE', 'Last IE must be GenericIE'
-    while classes:
-        for c in classes[:]:
-            bases = set(c.__bases__) - {object, *ignored_bases}
-            restart = False
-            for b in sorted(bases, key=lambda x: x.__name__):
-                if b not in classes and b not in returned_classes:
-                    assert b.__name__ != 'GenericIE', 'Cannot inherit from GenericIE'
-                    classes.insert(0, b)
-                    restart = True
-            if restart:
-                break
-            if bases <= returned_classes:
-                yield c
-                returned_classes.add(c)
-                classes.remove(c)
-                break
+    ignored_bases = {object, *ignored_bases}
+    # Ties are broken by position in `ies`, since it decides the URL matching order.
+    # Base classes that are not in `ies` are created as early as possible
+    priority = {c: i for i, c in enumerate(ies[:-1])}
+    extra_priority = itertools.count(-1, -1)
+    deps, rdeps = {}, collections.defaultdict(list)
+    pending = list(priority)
+    while pending:
+        c = pending.pop()
+        if c in deps:
+            continue
+        deps[c] = set(c.__bases__) - ignored_bases
+        for b in deps[c]:
+            rdeps[b].append(c)
+            if b not in priority:
+                assert b.__name__ != 'GenericIE', 'Cannot inherit from GenericIE'
+                priority[b] = next(extra_priority)
+                pending.append(b)
+
+    ready = [(priority[c], c) for c, bases in deps.items() if not bases]
+    heapq.heapify(ready)
+    while ready:
+        _, c = heapq.heappop(ready)
+        yield c
+        for sub in rdeps[c]:
+            deps[sub].remove(c)
+            if not deps[sub]:
+                heapq.heappush(ready, (priority[sub], sub))
     yield ies[-1]
 
 
 def build_lazy_ie(ie, name, attr_base):
-    bases = ', '.join({
-        'InfoExtractor': 'LazyLoadExtractor',
-        'SearchInfoExtractor': 'LazyLoadSearchExtractor',
-    }.get(base.__name__, base.__name__) for base in ie.__bases__)
-
-    s = IE_TEMPLATE.format(name=name, module=ie.__module__, bases=bases)
-    return s + '\n'.join(extra_ie_code(ie, attr_base))
+    bases = ', '.join(LAZY_BASE_NAMES.get(base.__name__, base.__name__) for base in ie.__bases__)
+    return '\n'.join((
+        f'\nclass {name}({bases}):\n    _module = {ie.__module__!r}',
+        *extra_ie_code(ie, attr_base),
+    ))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+import random
+
+from yt_dlp.extractor import VKWallPostIE
+
+_BASE64_CHARS = VKWallPostIE._BASE64_CHARS
+
+
+def _reference_decode(enc):
+    dec = ''
+    e = n = 0
+    for c in enc:
+        r = _BASE64_CHARS.index(c)
+        cond = n % 4
+        e = 64 * e + r if cond else r
+        n += 1
+        if cond:
+            dec += chr(255 & e >> (-2 * n & 6))
+    return dec
+
+
+class TestVKDecode(unittest.TestCase):
+    def setUp(self):
+        self.ie = VKWallPostIE()
+
+    def test_decode(self):
+        self.assertEqual(self.ie._decode(''), '')
+        self.assertEqual(self.ie._decode('a'), '')
+        self.assertEqual(self.ie._decode('ab=='), '\x00 @')
+        self.assertEqual(self.ie._decode('aaaa'), '\x00\x00\x00')
+
+    def test_decode_matches_reference(self):
+        rng = random.Random(0)
+        for _ in range(2000):
+            enc = ''.join(rng.choices(_BASE64_CHARS, k=rng.randrange(20)))
+            self.assertEqual(self.ie._decode(enc), _reference_decode(enc), enc)
+
+    def test_decode_invalid(self):
+        with self.assertRaises(ValueError):
+            self.ie._decode('ab!c')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,6 +14,12 @@ def aes_gcm_decrypt_and_verify_bytes(data, key, tag, nonce):
         """ Decrypt bytes with AES-GCM using pycryptodome """
         return Cryptodome.AES.new(key, Cryptodome.AES.MODE_GCM, nonce).decrypt_and_verify(data, tag)
 
+    def aes_ecb_encrypt_bytes(data, key):
+        """ Encrypt bytes with AES-ECB using pycryptodome. An incomplete last block is PKCS#7 padded """
+        remaining_length = -len(data) % BLOCK_SIZE_BYTES
+        data += bytes([remaining_length]) * remaining_length
+        return Cryptodome.AES.new(key, Cryptodome.AES.MODE_ECB).encrypt(data)
+
 else:
     def aes_cbc_decrypt_bytes(data, key, iv):
         """ Decrypt bytes with AES-CBC using native implementation since pycryptodome is unavailable """
@@ -23,6 +29,10 @@ def aes_gcm_decrypt_and_verify_bytes(data, key, tag, nonce):
         """ Decrypt bytes with AES-GCM using native implementation since pycryptodome is unavailable """
         return intlist_to_bytes(aes_gcm_decrypt_and_verify(*map(bytes_to_intlist, (data, key, tag, nonce))))
 
+    def aes_ecb_encrypt_bytes(data, key):
+        """ Encrypt bytes with AES-ECB using native implementation since pycryptodome is unavailable """
+        return intlist_to_bytes(aes_ecb_encrypt(*map(bytes_to_intlist, (data, key))))
+
 
 def aes_cbc_encrypt_bytes(data, key, iv, **kwargs):
     return intlist_to_bytes(aes_cbc_encrypt(*map(bytes_to_intlist, (data, key, iv)), **kwargs))
@@ -546,6 +556,7 @@ def ghash(subkey, data):
     'aes_cbc_encrypt_bytes',
     'aes_ctr_encrypt',
     'aes_ecb_encrypt',
+    'aes_ecb_encrypt_bytes',
     'aes_encrypt',
 
     'key_expansion',
@@ -1,7 +1,7 @@
 import functools
+import re
 
 from .common import InfoExtractor
-from .vimeo import VHXEmbedIE
 from ..utils import (
     ExtractorError,
     OnDemandPagedList,
@@ -10,16 +10,27 @@
     get_element_by_class,
     get_element_by_id,
     get_elements_html_by_class,
-    int_or_none,
-    traverse_obj,
+    smuggle_url,
     unified_strdate,
     urlencode_postdata,
 )
 
+_VHX_IE_KEY = 'VHXEmbed'
+_WATCH_UNAUTHORIZED = '<div id="watch-unauthorized"'
+_AUTH_TOKEN_RE = re.compile(r'name=["\']authenticity_token["\'] value=["\'](.+?)["\']')
+_SUBSCRIPTION_RE = re.compile(r'user_has_subscription:\s*["\'](.+?)["\']')
+_EMBED_URL_RE = re.compile(r'embed_url:\s*["\'](.+?)["\']')
+_EMBED_ID_RE = re.compile(r'embed\.vhx\.tv/videos/(.+?)\?')
+_SEASON_EPISODE_RE = re.compile(r'\b(?P<field>Season|Episode) (?P<number>\d+)')
+_RELEASE_DATE_RE = re.compile(
+    r'data-meta-field-name=["\']release_dates["\'] data-meta-field-value=["\'](.+?)["\']')
+
 
 class DropoutIE(InfoExtractor):
-    _LOGIN_URL = 'https://www.dropout.tv/login'
+    _HOST = 'https://www.dropout.tv'
+    _LOGIN_URL = f'{_HOST}/login'
     _NETRC_MACHINE = 'dropout'
+    _auth_token_cache = (None, None)
 
     _VALID_URL = r'https?://(?:www\.)?dropout\.tv/(?:[^/]+/)*videos/(?P<id>[^/]+)/?$'
     _TESTS = [
@@ -91,12 +102,19 @@ class DropoutIE(InfoExtractor):
         },
     ]
 
+    def _get_session_id(self):
+        session = self._get_cookies(self._HOST).get('_session')
+        return session.value if session else None
+
     def _get_authenticity_token(self, display_id):
-        signin_page = self._download_webpage(
-            self._LOGIN_URL, display_id, note='Getting authenticity token')
-        return self._html_search_regex(
-            r'name=["\']authenticity_token["\'] value=["\'](.+?)["\']',
-            signin_page, 'authenticity_token')
+        # The token is bound to the session, so it can be reused for as long as the session cookie is unchanged
+        session_id, token = self._auth_token_cache
+        if not token or session_id != self._get_session_id():
+            signin_page = self._download_webpage(
+                self._LOGIN_URL, display_id, note='Getting authenticity token')
+            token = self._html_search_regex(_AUTH_TOKEN_RE, signin_page, 'authenticity_token')
+            self._auth_token_cache = (self._get_session_id(), token)
+        return token
 
     def _login(self, display_id):
         username, password = self._get_login_info()
@@ -113,7 +131,7 @@ def _login(self, display_id):
             }))
 
         user_has_subscription = self._search_regex(
-            r'user_has_subscription:\s*["\'](.+?)["\']', response, 'subscription status', default='none')
+            _SUBSCRIPTION_RE, response, 'subscription status', default='none')
         if user_has_subscription.lower() == 'true':
             return
         elif user_has_subscription.lower() == 'false':
@@ -125,31 +143,35 @@ def _real_extract(self, url):
         display_id = self._match_id(url)
 
         webpage = None
-        if self._get_cookies('https://www.dropout.tv').get('_session'):
+        if self._get_session_id():
             webpage = self._download_webpage(url, display_id)
-        if not webpage or '<div id="watch-unauthorized"' in webpage:
+        if not webpage or _WATCH_UNAUTHORIZED in webpage:
             login_err = self._login(display_id)
-            webpage = self._download_webpage(url, display_id)
-            if login_err and '<div id="watch-unauthorized"' in webpage:
+            # Without credentials the session is unchanged, so the page would still be unauthorized
+            if not webpage or login_err is not True:
+                webpage = self._download_webpage(url, display_id)
+            if login_err and _WATCH_UNAUTHORIZED in webpage:
                 if login_err is True:
                     self.raise_login_required(method='any')
                 raise ExtractorError(login_err, expected=True)
 
-        embed_url = self._search_regex(r'embed_url:\s*["\'](.+?)["\']', webpage, 'embed url')
+        embed_url = self._search_regex(_EMBED_URL_RE, webpage, 'embed url')
         thumbnail = self._og_search_thumbnail(webpage)
         watch_info = get_element_by_id('watch-info', webpage) or ''
 
         title = clean_html(get_element_by_class('video-title', watch_info))
         season_episode = get_element_by_class(
             'site-font-secondary-color', get_element_by_class('text', watch_info))
-        episode_number = int_or_none(self._search_regex(
-            r'Episode (\d+)', season_episode or '', 'episode', default=None))
+        numbers = {}
+        for mobj in _SEASON_EPISODE_RE.finditer(season_episode or ''):
+            numbers.setdefault(mobj.group('field'), int(mobj.group('number')))
+        episode_number = numbers.get('Episode')
 
         return {
             '_type': 'url_transparent',
-            'ie_key': VHXEmbedIE.ie_key(),
-            'url': VHXEmbedIE._smuggle_referrer(embed_url, 'https://www.dropout.tv'),
-            'id': self._search_regex(r'embed\.vhx\.tv/videos/(.+?)\?', embed_url, 'id'),
+            'ie_key': _VHX_IE_KEY,
+            'url': smuggle_url(embed_url, {'referer': self._HOST}),
+            'id': self._search_regex(_EMBED_ID_RE, embed_url, 'id'),
             'display_id': display_id,
             'title': title,
             'description': self._html_search_meta('description', webpage, fatal=False),
@@ -157,11 +179,9 @@ def _real_extract(self, url):
             'series': clean_html(get_element_by_class('series-title', watch_info)),
             'episode_number': episode_number,
             'episode': title if episode_number else None,
-            'season_number': int_or_none(self._search_regex(
-                r'Season (\d+),', season_episode or '', 'season', default=None)),
+            'season_number': numbers.get('Season'),
             'release_date': unified_strdate(self._search_regex(
-                r'data-meta-field-name=["\']release_dates["\'] data-meta-field-value=["\'](.+?)["\']',
-                watch_info, 'release date', default=None)),
+                _RELEASE_DATE_RE, watch_info, 'release date', default=None)),
         }
 
 
@@ -211,8 +231,9 @@ def _fetch_page(self, url, season_id, page):
         page += 1
         webpage = self._download_webpage(
             f'{url}?page={page}', season_id, note=f'Downloading page {page}', expected_status={400})
-        yield from [self.url_result(item_url, DropoutIE) for item_url in traverse_obj(
-            get_elements_html_by_class('browse-item-link', webpage), (..., {extract_attributes}, 'href'))]
+        return [self.url_result(href, DropoutIE) for href in (
+            extract_attributes(el).get('href') for el in get_elements_html_by_class('browse-item-link', webpage))
+            if href]
 
     def _real_extract(self, url):
         season_id = self._match_id(url)
@@ -1,3 +1,5 @@
+import concurrent.futures
+import functools
 import hashlib
 import itertools
 import json
@@ -6,7 +8,7 @@
 import time
 
 from .common import InfoExtractor
-from ..aes import aes_ecb_encrypt, pkcs7_padding
+from ..aes import BLOCK_SIZE_BYTES, aes_ecb_encrypt_bytes
 from ..utils import (
     ExtractorError,
     int_or_none,
@@ -33,36 +35,42 @@ class NetEaseMusicBaseIE(InfoExtractor):
         'jymaster',  # SVIP tier; 超清母带 (Master); 192kHz/24bit flac
         'sky',       # SVIP tier; 沉浸环绕声 (Surround Audio); flac
     )
+    _LEVEL_TIERS = (_LEVELS[:3], _LEVELS[3:6], _LEVELS[6:])
     _API_BASE = 'http://music.163.com/api/'
     _GEO_BYPASS = False
+    _SONG_INFO_BATCH_SIZE = 100
+    _EAPI_COOKIES = {
+        'osver': 'undefined',
+        'deviceId': 'undefined',
+        'appver': '8.0.0',
+        'versioncode': '140',
+        'mobilename': 'undefined',
+        'buildver': '1623435496',
+        'resolution': '1920x1080',
+        '__csrf': '',
+        'os': 'pc',
+        'channel': 'undefined',
+    }
+    _EAPI_COOKIE_HEADER = '; '.join(f'{k}={v}' for k, v in _EAPI_COOKIES.items())
 
     @staticmethod
     def _kilo_or_none(value):
         return int_or_none(value, scale=1000)
 
     def _create_eapi_cipher(self, api_path, query_body, cookies):
-        request_text = json.dumps({**query_body, 'header': cookies}, separators=(',', ':'))
-
-        message = f'nobody{api_path}use{request_text}md5forencrypt'.encode('latin1')
-        msg_digest = hashlib.md5(message).hexdigest()
-
-        data = pkcs7_padding(list(str.encode(
-            f'{api_path}-36cd479b6b5-{request_text}-36cd479b6b5-{msg_digest}')))
-        encrypted = bytes(aes_ecb_encrypt(data, list(b'e82ckenh8dichen8')))
+        # json.dumps escapes non-ASCII, so the text is the same in any ASCII-compatible encoding
+        request_text = json.dumps({**query_body, 'header': cookies}, separators=(',', ':')).encode()
+        api_path = api_path.encode()
+
+        msg_digest = hashlib.md5(b'nobody%buse%bmd5forencrypt' % (api_path, request_text)).hexdigest()
+        data = b'%b-36cd479b6b5-%b-36cd479b6b5-%b' % (api_path, request_text, msg_digest.encode())
+        padding_length = BLOCK_SIZE_BYTES - len(data) % BLOCK_SIZE_BYTES  # PKCS#7
+        encrypted = aes_ecb_encrypt_bytes(
+            data + bytes([padding_length]) * padding_length, b'e82ckenh8dichen8')
         return f'params={encrypted.hex().upper()}'.encode()
 
     def _download_eapi_json(self, path, video_id, query_body, headers={}, **kwargs):
-        cookies = {
-            'osver': 'undefined',
-            'deviceId': 'undefined',
-            'appver': '8.0.0',
-            'versioncode': '140',
-            'mobilename': 'undefined',
-            'buildver': '1623435496',
-            'resolution': '1920x1080',
-            '__csrf': '',
-            'os': 'pc',
-            'channel': 'undefined',
+        request_cookies = {
             'requestId': f'{int(time.time() * 1000)}_{random.randint(0, 1000):04}',
             **traverse_obj(self._get_cookies(self._API_BASE), {
                 'MUSIC_U': ('MUSIC_U', {lambda i: i.value}),
@@ -70,9 +78,11 @@ def _download_eapi_json(self, path, video_id, query_body, headers={}, **kwargs):
         }
         return self._download_json(
             urljoin('https://interface3.music.163.com/', f'/eapi{path}'), video_id,
-            data=self._create_eapi_cipher(f'/api{path}', query_body, cookies), headers={
+            data=self._create_eapi_cipher(
+                f'/api{path}', query_body, {**self._EAPI_COOKIES, **request_cookies}), headers={
                 'Referer': 'https://music.163.com',
-                'Cookie': '; '.join([f'{k}={v}' for k, v in cookies.items()]),
+                'Cookie': '; '.join((
+                    self._EAPI_COOKIE_HEADER, *(f'{k}={v}' for k, v in request_cookies.items()))),
                 **headers,
             }, **kwargs)
 
@@ -82,12 +92,28 @@ def _call_player_api(self, song_id, level):
             {'ids': f'[{song_id}]', 'level': level, 'encodeType': 'flac'},
             note=f'Downloading song URL info: level {level}')
 
+    def _iter_player_api_responses(self, song_id):
+        # 'standard' is requested alone first: _extract_formats stops right there for songs that are
+        # unavailable or geo-restricted, and for programs, which only have a single level
+        first_level, *levels = self._LEVELS
+        yield first_level, self._call_player_api(song_id, first_level)
+        if self.get_param('sleep_interval_requests'):
+            # Requests from worker threads would not be spaced out by --sleep-requests
+            for level in levels:
+                yield level, self._call_player_api(song_id, level)
+            return
+        # The remaining levels of a tier are requested concurrently. Since _extract_formats stops
+        # at the first level that the account's tier does not have, at most one tier is wasted
+        tiers = (self._LEVEL_TIERS[0][1:], *self._LEVEL_TIERS[1:])
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(map(len, tiers))) as executor:
+            for tier in tiers:
+                yield from zip(tier, executor.map(functools.partial(self._call_player_api, song_id), tier))
+
     def _extract_formats(self, info):
         formats = []
         song_id = info['id']
-        for level in self._LEVELS:
-            song = traverse_obj(
-                self._call_player_api(song_id, level), ('data', lambda _, v: url_or_none(v['url']), any))
+        for level, response in self._iter_player_api_responses(song_id):
+            song = traverse_obj(response, ('data', lambda _, v: url_or_none(v['url']), any))
             if not song:
                 break  # Media is not available due to removal or geo-restriction
             actual_level = song.get('level')
@@ -124,9 +150,15 @@ def _query_api(self, endpoint, video_id, note):
         return result
 
     def _get_entries(self, songs_data, entry_keys=None, id_key='id', name_key='name'):
-        for song in traverse_obj(songs_data, (
-                *variadic(entry_keys, (str, bytes, dict, set)),
-                lambda _, v: int_or_none(v[id_key]) is not None)):
+        songs = traverse_obj(songs_data, (
+            *variadic(entry_keys, (str, bytes, dict, set)),
+            lambda _, v: int_or_none(v[id_key]) is not None))
+        if self._downloader:
+            # No request is made here; the song extractor uses the order of the entries
+            # to download the details of the ones it is asked for in batches
+            self._downloader.get_info_extractor(NetEaseMusicIE.ie_key())._queue_song_ids(
+                str(song[id_key]) for song in songs)
+        for song in songs:
             song_id = str(song[id_key])
             yield self.url_result(
                 f'http://music.163.com/#/song?id={song_id}', NetEaseMusicIE,
@@ -137,6 +169,7 @@ class NetEaseMusicIE(NetEaseMusicBaseIE):
     IE_NAME = 'netease:song'
     IE_DESC = '网易云音乐'
     _VALID_URL = r'https?://(?:y\.)?music\.163\.com/(?:[#m]/)?song\?.*?\bid=(?P<id>[0-9]+)'
+    _LYRICS_RE = re.compile(r'(\[[0-9]{2}:[0-9]{2}\.[0-9]{2,}\])([^\n]+)')
     _TESTS = [{
         'url': 'https://music.163.com/#/song?id=550136151',
         'info_dict': {
@@ -232,6 +265,40 @@ class NetEaseMusicIE(NetEaseMusicBaseIE):
         'skip': 'Blocked outside Mainland China',
     }]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._upcoming_song_ids = []
+        self._song_info_cache = {}
+        self._song_info_batch_size = 1
+
+    def _queue_song_ids(self, song_ids):
+        """Remember the songs of a playlist, in order, so that their details can be batched"""
+        self._upcoming_song_ids = list(song_ids)
+        self._song_info_cache = {}
+        self._song_info_batch_size = 1
+
+    def _download_song_infos(self, song_ids):
+        try:
+            info = self._query_api(
+                f'song/detail?ids=%5B{",".join(song_ids)}%5D', None, f'Downloading info of {len(song_ids)} songs')
+        except ExtractorError as e:
+            self.report_warning(f'Unable to download song details in bulk; they will be fetched one by one: {e}')
+            return {}
+        return {str(song['id']): song for song in traverse_obj(info, ('songs', lambda _, v: v['id']))}
+
+    def _get_song_info(self, song_id):
+        if song_id not in self._song_info_cache and song_id in self._upcoming_song_ids:
+            # Download the details of this and the following playlist entries together. The batch
+            # doubles with every request, so at most about as many songs as were used are wasted
+            # when the playlist is cut short, and only the latest batch is kept
+            start = self._upcoming_song_ids.index(song_id)
+            batch = self._upcoming_song_ids[start:start + self._song_info_batch_size]
+            del self._upcoming_song_ids[:start + len(batch)]
+            self._song_info_batch_size = min(2 * self._song_info_batch_size, self._SONG_INFO_BATCH_SIZE)
+            self._song_info_cache = self._download_song_infos(batch) if len(batch) > 1 else {}
+        return self._song_info_cache.pop(song_id, None) or self._query_api(
+            f'song/detail?id={song_id}&ids=%5B{song_id}%5D', song_id, 'Downloading song info')['songs'][0]
+
     def _process_lyrics(self, lyrics_info):
         original = traverse_obj(lyrics_info, ('lrc', 'lyric', {str}))
         translated = traverse_obj(lyrics_info, ('tlyric', 'lyric', {str}))
@@ -244,13 +311,10 @@ def _process_lyrics(self, lyrics_info):
                 'lyrics': [{'data': original, 'ext': 'lrc'}],
             }
 
-        lyrics_expr = r'(\[[0-9]{2}:[0-9]{2}\.[0-9]{2,}\])([^\n]+)'
-        original_ts_texts = re.findall(lyrics_expr, original)
-        translation_ts_dict = dict(re.findall(lyrics_expr, translated))
-
+        translation_ts_dict = dict(self._LYRICS_RE.findall(translated))
         merged = '\n'.join(
             join_nonempty(f'{timestamp}{text}', translation_ts_dict.get(timestamp, ''), delim=' / ')
-            for timestamp, text in original_ts_texts)
+            for timestamp, text in self._LYRICS_RE.findall(original))
 
         return {
             'lyrics_merged': [{'data': merged, 'ext': 'lrc'}],
@@ -261,8 +325,7 @@ def _process_lyrics(self, lyrics_info):
     def _real_extract(self, url):
         song_id = self._match_id(url)
 
-        info = self._query_api(
-            f'song/detail?id={song_id}&ids=%5B{song_id}%5D', song_id, 'Downloading song info')['songs'][0]
+        info = self._get_song_info(song_id)
 
         formats = self._extract_formats(info)
 
@@ -620,17 +683,40 @@ class NetEaseMusicDjRadioIE(NetEaseMusicBaseIE):
         'playlist_mincount': 40,
     }
     _PAGE_SIZE = 1000
+    _MAX_PAGE_WORKERS = 4
+
+    def _fetch_programs(self, dj_id, offset):
+        return self._query_api(
+            f'dj/program/byradio?asc=false&limit={self._PAGE_SIZE}&radioId={dj_id}&offset={offset}',
+            dj_id, note=f'Downloading dj programs - {offset}')
+
+    def _iter_program_pages(self, dj_id):
+        info = self._fetch_programs(dj_id, 0)
+        yield info
+        if not info['more']:
+            return
+        # The first page reports the total number of programs, so the remaining pages are known
+        # up front and can be requested concurrently. Otherwise, or if requests must be spaced
+        # out by --sleep-requests (which worker threads would bypass), follow 'more' page by page
+        total = traverse_obj(info, ('count', {int_or_none}))
+        if total and not self.get_param('sleep_interval_requests'):
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self._MAX_PAGE_WORKERS) as executor:
+                yield from executor.map(
+                    functools.partial(self._fetch_programs, dj_id),
+                    range(self._PAGE_SIZE, total, self._PAGE_SIZE))
+            return
+        for offset in itertools.count(start=self._PAGE_SIZE, step=self._PAGE_SIZE):
+            info = self._fetch_programs(dj_id, offset)
+            yield info
+            if not info['more']:
+                break
 
     def _real_extract(self, url):
         dj_id = self._match_id(url)
 
         metainfo = {}
         entries = []
-        for offset in itertools.count(start=0, step=self._PAGE_SIZE):
-            info = self._query_api(
-                f'dj/program/byradio?asc=false&limit={self._PAGE_SIZE}&radioId={dj_id}&offset={offset}',
-                dj_id, note=f'Downloading dj programs - {offset}')
-
+        for info in self._iter_program_pages(dj_id):
             entries.extend(self.url_result(
                 f'http://music.163.com/#/program?id={program["id"]}', NetEaseMusicProgramIE,
                 program['id'], program.get('name')) for program in info['programs'])
@@ -640,7 +726,4 @@ def _real_extract(self, url):
                     'description': ('desc', {str}),
                 }))
 
-            if not info['more']:
-                break
-
         return self.playlist_result(entries, dj_id, **metainfo)
@@ -1,3 +1,5 @@
+import concurrent.futures
+import functools
 import json
 
 from .common import InfoExtractor
@@ -41,7 +43,6 @@ class OnDemandChinaEpisodeIE(InfoExtractor):
                 titleKo
                 titleZhHans
                 titleZhHant
-                synopsis
                 synopsisEn
                 synopsisKo
                 synopsisZhHans
@@ -52,41 +53,68 @@ class OnDemandChinaEpisodeIE(InfoExtractor):
                 }
             }
         }'''
+    # The query is static, so it is serialized once; only the variables are dumped per request
+    _QUERY_PAYLOAD_PREFIX = json.dumps({'operationName': 'Episode', 'query': _QUERY})[:-1].encode()
 
-    def _real_extract(self, url):
-        program_slug, display_id, ep_number = self._match_valid_url(url).group('series', 'id', 'ep')
-        webpage = self._download_webpage(url, display_id)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._episode_info_cache = {}
 
-        video_info = self._download_json(
-            'https://odc-graphql.odkmedia.io/graphql', display_id,
-            headers={'Content-type': 'application/json'},
-            data=json.dumps({
-                'operationName': 'Episode',
-                'query': self._QUERY,
-                'variables': {
+    def _get_episode_info(self, program_slug, episode_number, display_id):
+        key = (program_slug, episode_number)
+        if key not in self._episode_info_cache:
+            self._episode_info_cache[key] = self._download_json(
+                'https://odc-graphql.odkmedia.io/graphql', display_id,
+                headers={'Content-type': 'application/json'},
+                data=b'%b, "variables": %b}' % (self._QUERY_PAYLOAD_PREFIX, json.dumps({
                     'programSlug': program_slug,
-                    'episodeNumber': int(ep_number),
-                },
-            }).encode())['data']['episode']
+                    'episodeNumber': episode_number,
+                }).encode()))['data']['episode']
+        return self._episode_info_cache[key]
 
+    def _extract_formats_and_subtitles(self, video_id, display_id):
         try:
             source_json = self._download_json(
-                f'https://odkmedia.io/odc/api/v2/playback/{video_info["id"]}/', display_id,
+                f'https://odkmedia.io/odc/api/v2/playback/{video_id}/', display_id,
                 headers={'Authorization': '', 'service-name': 'odc'})
         except ExtractorError as e:
             if isinstance(e.cause, HTTPError):
                 error_data = self._parse_json(e.cause.response.read(), display_id)['detail']
                 raise GeoRestrictedError(error_data)
 
-        formats, subtitles = [], {}
+        hls_urls = []
         for source in traverse_obj(source_json, ('sources', ...)):
             if source.get('type') == 'hls':
-                fmts, subs = self._extract_m3u8_formats_and_subtitles(source.get('url'), display_id)
-                formats.extend(fmts)
-                self._merge_subtitles(subs, target=subtitles)
+                hls_urls.append(source.get('url'))
             else:
                 self.report_warning(f'Unsupported format {source.get("type")}', display_id)
 
+        # Sources may list the same manifest more than once; download and parse each URL only once
+        hls_urls = list(dict.fromkeys(hls_urls))
+
+        extract = functools.partial(self._extract_m3u8_formats_and_subtitles, video_id=display_id)
+        if len(hls_urls) > 1 and not self.get_param('sleep_interval_requests'):
+            # The manifests are independent, so fetch them concurrently; map keeps the source order.
+            # Not with --sleep-requests, since requests from worker threads would not be spaced out
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(hls_urls))) as executor:
+                results = list(executor.map(extract, hls_urls))
+        else:
+            results = map(extract, hls_urls)
+
+        formats, subtitles = [], {}
+        for fmts, subs in results:
+            formats.extend(fmts)
+            self._merge_subtitles(subs, target=subtitles)
+        return formats, subtitles
+
+    def _real_extract(self, url):
+        program_slug, display_id, ep_number = self._match_valid_url(url).group('series', 'id', 'ep')
+
+        webpage = self._download_webpage(url, display_id)
+
+        video_info = self._get_episode_info(program_slug, int(ep_number), display_id)
+        formats, subtitles = self._extract_formats_and_subtitles(video_info['id'], display_id)
+
         return {
             'id': str(video_info['id']),
             'duration': float_or_none(video_info.get('videoDuration'), 1000),
@@ -97,7 +125,7 @@ def _real_extract(self, url):
                       or self._html_extract_title(webpage)),
             'alt_title': traverse_obj(video_info, 'titleKo', 'titleZhHans', 'titleZhHant'),
             'description': (traverse_obj(
-                video_info, 'synopsisEn', 'synopsisKo', 'synopsisZhHans', 'synopsisZhHant', 'synopisis')
+                video_info, 'synopsisEn', 'synopsisKo', 'synopsisZhHans', 'synopsisZhHant')
                 or self._html_search_meta(['og:description', 'twitter:description', 'description'], webpage)),
             'formats': formats,
             'subtitles': subtitles,
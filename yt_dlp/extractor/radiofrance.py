@@ -92,6 +92,10 @@ class FranceCultureIE(RadioFranceBaseIE):
         /(?:{RadioFranceBaseIE._STATIONS_RE})
         /podcasts/(?:[^?#]+/)?(?P<display_id>[^?#]+)-(?P<id>\d{{6,}})(?:$|[?#])
     '''
+    _TITLE_RE = re.compile(r'(?s)<h1[^>]*itemprop="[^"]*name[^"]*"[^>]*>(.+?)</h1>')
+    _DESC_RE = re.compile(r'(?s)<meta name="description"\s*content="([^"]+)')
+    _UPLOADER_RE = re.compile(r'(?s)<span class="author">(.*?)</span>')
+    _DATE_RE = re.compile(r'"datePublished"\s*:\s*"([^"]+)')
 
     _TESTS = [
         {
@@ -142,15 +146,15 @@ def _real_extract(self, url):
             'url': video_data['contentUrl'],
             'vcodec': 'none' if video_data.get('encodingFormat') == 'mp3' else None,
             'duration': parse_duration(video_data.get('duration')),
-            'title': self._html_search_regex(r'(?s)<h1[^>]*itemprop="[^"]*name[^"]*"[^>]*>(.+?)</h1>',
-                                             webpage, 'title', default=self._og_search_title(webpage)),
+            'title': (self._html_search_regex(self._TITLE_RE, webpage, 'title', default=None)
+                      or self._og_search_title(webpage)),
             'description': self._html_search_regex(
-                r'(?s)<meta name="description"\s*content="([^"]+)', webpage, 'description', default=None),
+                self._DESC_RE, webpage, 'description', default=None),
             'thumbnail': self._og_search_thumbnail(webpage),
             'uploader': self._html_search_regex(
-                r'(?s)<span class="author">(.*?)</span>', webpage, 'uploader', default=None),
+                self._UPLOADER_RE, webpage, 'uploader', default=None),
             'upload_date': unified_strdate(self._search_regex(
-                r'"datePublished"\s*:\s*"([^"]+)', webpage, 'timestamp', fatal=False)),
+                self._DATE_RE, webpage, 'timestamp', fatal=False)),
         }
 
 
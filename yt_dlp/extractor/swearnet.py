@@ -1,6 +1,10 @@
+import re
+
 from .vidyard import VidyardBaseIE
 from ..utils import ExtractorError, int_or_none, make_archive_id
 
+_EXTERNAL_ID_RE = re.compile(r'externalid\s*=\s*"([^"]+)')
+
 
 class SwearnetEpisodeIE(VidyardBaseIE):
     _VALID_URL = r'https?://www\.swearnet\.com/shows/(?P<id>[\w-]+)/seasons/(?P<season_num>\d+)/episodes/(?P<episode_num>\d+)'
@@ -28,7 +32,7 @@ def _real_extract(self, url):
         webpage = self._download_webpage(url, slug)
 
         try:
-            external_id = self._search_regex(r'externalid\s*=\s*"([^"]+)', webpage, 'externalid')
+            external_id = self._search_regex(_EXTERNAL_ID_RE, webpage, 'externalid')
         except ExtractorError:
             if 'Upgrade Now' in webpage:
                 self.raise_login_required()
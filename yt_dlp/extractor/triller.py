@@ -52,6 +52,8 @@ def _perform_login(self, username, password):
         self._API_HEADERS['Authorization'] = f'Bearer {login["auth_token"]}'
 
     def _get_comments(self, video_id, limit=15):
+        if limit == 0:  # The video has no comments
+            return
         comment_info = self._download_json(
             f'{self._API_BASE_URL}/api/videos/{video_id}/comments_v2',
             video_id, fatal=False, note='Downloading comments API JSON',
@@ -247,6 +249,11 @@ class TrillerUserIE(TrillerBaseIE):
         },
     }]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Keyed by the auth token too, so that logging in invalidates the cached responses
+        self._user_info_cache = {}
+
     def _real_initialize(self):
         if not self._API_HEADERS.get('Authorization'):
             guest = self._download_json(
@@ -260,6 +267,14 @@ def _real_initialize(self):
 
             self._API_HEADERS['Authorization'] = f'Bearer {guest["auth_token"]}'
 
+    def _get_user_info(self, username):
+        key = (self._API_HEADERS.get('Authorization'), username)
+        if key not in self._user_info_cache:
+            self._user_info_cache[key] = self._download_json(
+                f'{self._API_BASE_URL}/api/users/by_username/{username}',
+                username, note='Downloading user info', headers=self._API_HEADERS)
+        return self._user_info_cache[key]
+
     def _entries(self, username, user_id, limit=6):
         query = {'limit': limit}
         for page in itertools.count(1):
@@ -278,9 +293,7 @@ def _entries(self, username, user_id, limit=6):
     def _real_extract(self, url):
         username = self._match_id(url)
 
-        user_info = traverse_obj(self._download_json(
-            f'{self._API_BASE_URL}/api/users/by_username/{username}',
-            username, note='Downloading user info', headers=self._API_HEADERS), ('user', {dict})) or {}
+        user_info = traverse_obj(self._get_user_info(username), ('user', {dict})) or {}
 
         if user_info.get('private') and user_info.get('followed_by_me') not in (True, 'true'):
             raise ExtractorError('This user profile is private', expected=True)
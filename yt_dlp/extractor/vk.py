@@ -1,4 +1,4 @@
-import collections
+import base64
 import hashlib
 import re
 
@@ -30,6 +30,43 @@
     urljoin,
 )
 
+_SECURITY_CHECK_RE = re.compile(r'<!>/login\.php\?.*\bact=security_check')
+_ERROR_MESSAGE_RES = (
+    re.compile(r'(?s)<!><div[^>]+class="video_layer_message"[^>]*>(.+?)</div>'),
+    re.compile(r'(?s)<div[^>]+id="video_ext_msg"[^>]*>(.+?)</div>'),
+)
+_ERROR_COPYRIGHT = 'Video %s has been removed from public access due to rightholder complaint.'
+_ERRORS = tuple((re.compile(error_re), error_msg) for error_re, error_msg in (
+    (r'>Видеозапись .*? была изъята из публичного доступа в связи с обращением правообладателя.<',
+     _ERROR_COPYRIGHT),
+    (r'>The video .*? was removed from public access by request of the copyright holder.<',
+     _ERROR_COPYRIGHT),
+    (r'<!>Please log in or <',
+     ('Video %s is only available for registered users, '
+      'use --username and --password options to provide account credentials.')),
+    (r'<!>Unknown error',
+     'Video %s does not exist.'),
+    (r'<!>Видео временно недоступно',
+     'Video %s is temporarily unavailable.'),
+    (r'<!>Access denied',
+     'Access denied to video %s.'),
+    (r'<!>Видеозапись недоступна, так как её автор был заблокирован.',
+     'Video %s is no longer available, because its author has been blocked.'),
+    (r'<!>This video is no longer available, because its author has been blocked.',
+     'Video %s is no longer available, because its author has been blocked.'),
+    (r'<!>This video is no longer available, because it has been deleted.',
+     'Video %s is no longer available, because it has been deleted.'),
+    (r'<!>The video .+? is not available in your region.',
+     'Video %s is not available in your region.'),
+))
+_PLAYER_PARAMS_RE = re.compile(r'var\s+playerParams\s*=\s*({.+?})\s*;\s*\n')
+_RUTUBE_RE = re.compile(r'\ssrc="((?:https?:)?//rutube\.ru\\?/(?:video|play)\\?/embed(?:.*?))\\?"')
+_OPTS_RE = re.compile(r'(?s)var\s+opts\s*=\s*({.+?});')
+_OPTS_URL_RE = re.compile(r"url\s*:\s*'((?!/\b)[^']+)")
+_FORMAT_HEIGHT_RE = re.compile(r'(?:url|cache)(\d+)')
+_AUDIO_DATA_RE = re.compile(r'data-audio="([^"]+)')
+_POST_VIDEO_HREF_RE = re.compile(r'<a[^>]+href=(?:["\'])(/video(?:-?[\d_]+)[^"\']*)')
+
 
 class VKBaseIE(InfoExtractor):
     _NETRC_MACHINE = 'vk'
@@ -68,7 +105,7 @@ def _perform_login(self, username, password):
             note='Logging in',
             data=urlencode_postdata(login_form))
 
-        if re.search(r'onLoginFailed', login_page):
+        if 'onLoginFailed' in login_page:
             raise ExtractorError(
                 'Unable to login, incorrect username and/or password', expected=True)
 
@@ -341,59 +378,21 @@ def _real_extract(self, url):
                 'http://vk.com/video_ext.php?' + mobj.group('embed_query'), video_id)
 
             error_message = self._html_search_regex(
-                [r'(?s)<!><div[^>]+class="video_layer_message"[^>]*>(.+?)</div>',
-                    r'(?s)<div[^>]+id="video_ext_msg"[^>]*>(.+?)</div>'],
-                info_page, 'error message', default=None)
+                _ERROR_MESSAGE_RES, info_page, 'error message', default=None)
             if error_message:
                 raise ExtractorError(error_message, expected=True)
 
-            if re.search(r'<!>/login\.php\?.*\bact=security_check', info_page):
+            if _SECURITY_CHECK_RE.search(info_page):
                 raise ExtractorError(
                     'You are trying to log in from an unusual location. You should confirm ownership at vk.com to log in with this IP.',
                     expected=True)
 
-            ERROR_COPYRIGHT = 'Video %s has been removed from public access due to rightholder complaint.'
-
-            ERRORS = {
-                r'>Видеозапись .*? была изъята из публичного доступа в связи с обращением правообладателя.<':
-                ERROR_COPYRIGHT,
-
-                r'>The video .*? was removed from public access by request of the copyright holder.<':
-                ERROR_COPYRIGHT,
-
-                r'<!>Please log in or <':
-                'Video %s is only available for registered users, '
-                'use --username and --password options to provide account credentials.',
-
-                r'<!>Unknown error':
-                'Video %s does not exist.',
-
-                r'<!>Видео временно недоступно':
-                'Video %s is temporarily unavailable.',
-
-                r'<!>Access denied':
-                'Access denied to video %s.',
-
-                r'<!>Видеозапись недоступна, так как её автор был заблокирован.':
-                'Video %s is no longer available, because its author has been blocked.',
-
-                r'<!>This video is no longer available, because its author has been blocked.':
-                'Video %s is no longer available, because its author has been blocked.',
-
-                r'<!>This video is no longer available, because it has been deleted.':
-                'Video %s is no longer available, because it has been deleted.',
-
-                r'<!>The video .+? is not available in your region.':
-                'Video %s is not available in your region.',
-            }
-
-            for error_re, error_msg in ERRORS.items():
-                if re.search(error_re, info_page):
+            for error_re, error_msg in _ERRORS:
+                if error_re.search(info_page):
                     raise ExtractorError(error_msg % video_id, expected=True)
 
             player = self._parse_json(self._search_regex(
-                r'var\s+playerParams\s*=\s*({.+?})\s*;\s*\n',
-                info_page, 'player params'), video_id)
+                _PLAYER_PARAMS_RE, info_page, 'player params'), video_id)
 
         youtube_url = YoutubeIE._extract_url(info_page)
         if youtube_url:
@@ -407,8 +406,7 @@ def _real_extract(self, url):
         if pladform_url:
             return self.url_result(pladform_url, PladformIE.ie_key())
 
-        m_rutube = re.search(
-            r'\ssrc="((?:https?:)?//rutube\.ru\\?/(?:video|play)\\?/embed(?:.*?))\\?"', info_page)
+        m_rutube = _RUTUBE_RE.search(info_page)
         if m_rutube is not None:
             rutube_url = self._proto_relative_url(
                 m_rutube.group(1).replace('\\', ''))
@@ -426,9 +424,9 @@ def _real_extract(self, url):
         if sibnet_url:
             return self.url_result(sibnet_url)
 
-        m_opts = re.search(r'(?s)var\s+opts\s*=\s*({.+?});', info_page)
+        m_opts = _OPTS_RE.search(info_page)
         if m_opts:
-            m_opts_url = re.search(r"url\s*:\s*'((?!/\b)[^']+)", m_opts.group(1))
+            m_opts_url = _OPTS_URL_RE.search(m_opts.group(1))
             if m_opts_url:
                 opts_url = m_opts_url.group(1)
                 if opts_url.startswith('//'):
@@ -458,8 +456,8 @@ def _real_extract(self, url):
                 continue
             if (format_id.startswith(('url', 'cache'))
                     or format_id in ('extra_data', 'live_mp4', 'postlive_mp4')):
-                height = int_or_none(self._search_regex(
-                    r'^(?:url|cache)(\d+)', format_id, 'height', default=None))
+                m = _FORMAT_HEIGHT_RE.match(format_id)
+                height = int(m.group(1)) if m else None
                 formats.append({
                     'format_id': format_id,
                     'url': format_url,
@@ -534,8 +532,6 @@ class VKUserVideosIE(VKBaseIE):
         },
         'playlist_mincount': 108,
     }]
-    _VIDEO = collections.namedtuple('Video', ['owner_id', 'id'])
-
     def _entries(self, page_id, section):
         video_list_json = self._download_payload('al_video', page_id, {
             'act': 'load_videos_silent',
@@ -549,8 +545,7 @@ def _entries(self, page_id, section):
 
         while True:
             for video in video_list:
-                v = self._VIDEO._make(video[:2])
-                video_id = '%d_%d' % (v.owner_id, v.id)
+                video_id = f'{video[0]}_{video[1]}'
                 yield self.url_result(
                     'http://vk.com/video' + video_id, VKIE.ie_key(), video_id)
             if count >= total:
@@ -639,9 +634,20 @@ class VKWallPostIE(VKBaseIE):
         'only_matching': True,
     }]
     _BASE64_CHARS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMN0PQRSTUVWXYZO123456789+/='
-    _AUDIO = collections.namedtuple('Audio', ['id', 'owner_id', 'url', 'title', 'performer', 'duration', 'album_id', 'unk', 'author_link', 'lyrics', 'flags', 'context', 'extra', 'hashes', 'cover_url', 'ads'])
+    # VK's alphabet is a permutation of the standard base64 one
+    _BASE64_TRANS = str.maketrans(
+        _BASE64_CHARS[:64], 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/')
 
     def _decode(self, enc):
+        if '=' in enc:
+            # VK treats '=' as the digit 64, not as padding
+            return self._decode_chars(enc)
+        if len(enc) % 4 == 1:
+            enc = enc[:-1]  # A lone trailing character holds no complete byte
+        return base64.b64decode(
+            enc.translate(self._BASE64_TRANS) + '=' * (-len(enc) % 4), validate=True).decode('latin-1')
+
+    def _decode_chars(self, enc):
         dec = ''
         e = n = 0
         for c in enc:
@@ -684,8 +690,8 @@ def _real_extract(self, url):
 
         entries = []
 
-        for audio in re.findall(r'data-audio="([^"]+)', webpage):
-            audio = self._parse_json(unescapeHTML(audio), post_id)
+        for mobj in _AUDIO_DATA_RE.finditer(webpage):
+            audio = self._parse_json(unescapeHTML(mobj.group(1)), post_id)
             if not audio['url']:
                 continue
             title = unescapeHTML(audio.get('title'))
@@ -707,8 +713,7 @@ def _real_extract(self, url):
                 }],
             })
 
-        entries.extend(self.url_result(urljoin(url, entry), VKIE) for entry in set(re.findall(
-            r'<a[^>]+href=(?:["\'])(/video(?:-?[\d_]+)[^"\']*)',
+        entries.extend(self.url_result(urljoin(url, entry), VKIE) for entry in set(_POST_VIDEO_HREF_RE.findall(
             get_element_html_by_id('wl_post_body', webpage))))
 
         return self.playlist_result(